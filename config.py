@@ -18,6 +18,13 @@ class PDFParserConfig:
         r'^([A-Z][a-z\s]+)\n[-=]+$',       # Underlined headers
     ]
 
+    # Compiled once at class-creation time; re's internal cache is
+    # size-limited and shared, so holding our own compiled objects
+    # guarantees the patterns are never recompiled
+    COMPILED_SECTION_PATTERNS = tuple(
+        re.compile(pattern, re.MULTILINE) for pattern in SECTION_PATTERNS
+    )
+
     # Chart Detection Keywords
     CHART_KEYWORDS = [
         'chart', 'graph', 'figure', 'diagram', 'plot',
@@ -70,7 +77,7 @@ class PDFParserConfig:
     @classmethod
     def get_section_patterns(cls):
         """Get compiled regex patterns for section detection"""
-        return [re.compile(pattern, re.MULTILINE) for pattern in cls.SECTION_PATTERNS]
+        return list(cls.COMPILED_SECTION_PATTERNS)
 
     @classmethod
     def validate_config(cls):
@@ -2,6 +2,11 @@ import os
 import json
 import argparse
 import logging
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import re
@@ -17,10 +22,175 @@ except ImportError as e:
     print("Please install dependencies")
     exit(1)
 
+# orjson is an optional accelerator: its C encoder is several times faster
+# than the stdlib json module and works on bytes, skipping the intermediate
+# str. We fall back to json when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from config import PDFParserConfig
+
+def _compile_section_union():
+    """
+    Compile the fused section-heading pattern.
+
+    PDFParserConfig.SECTION_PATTERNS are fused into a single alternation
+    compiled once at import time, so each line costs one regex engine entry
+    instead of one per pattern; the named group that matched
+    (match.lastgroup) identifies which kind of heading was hit.
+
+    When the third-party `regex` module is installed it is used instead of
+    the stdlib engine, with the title-case run wrapped in an atomic group
+    (?>...) so the engine never backtracks over it on long near-miss lines.
+    """
+    try:
+        import regex as regex_mod
+    except ImportError:
+        regex_mod = None
+
+    engine = regex_mod if regex_mod is not None else re
+
+    # hws is "horizontal whitespace" (\s minus \n): the union is scanned
+    # over whole pages, so a bare \s would let a branch swallow newlines
+    # and merge consecutive lines into one heading. Optional leading hws on
+    # every branch preserves the old strip-then-match behavior for the
+    # indented headings PDF extraction commonly produces.
+    hws = r'[^\S\n]'
+    titlecase_run = rf'(?:[a-z]|{hws})+'
+    if regex_mod is not None:
+        titlecase_run = rf'(?>{titlecase_run})'
+
+    return engine.compile(
+        rf'^{hws}*\d+\.{hws}+(?P<numbered>[A-Z][^\n]+)$'              # 1. Section Name
+        rf'|^{hws}*(?P<allcaps>[A-Z](?:[A-Z]|{hws}){{3,}})$'          # ALL CAPS SECTIONS (min 3 chars)
+        rf'|^{hws}*(?P<titlecase>[A-Z]{titlecase_run}):'              # Title Case:
+        rf'|^{hws}*\*\*(?P<bold>[^*\n]+)\*\*'                         # **Bold sections**
+        rf'|^{hws}*##{hws}+(?P<md_h2>.+)$'                            # ## Markdown headers
+        rf'|^{hws}*#{hws}+(?P<md_h1>.+)$'                             # # Markdown headers
+        rf'|^{hws}*(?P<underlined>[A-Z](?:[a-z]|{hws})+)\n[-=]+$',    # Underlined headers
+        engine.MULTILINE,
+    )
+
+_SECTION_UNION = _compile_section_union()
+
+# Branches that open a new top-level section; all others are subsections.
+_SECTION_GROUPS = frozenset({"numbered", "allcaps"})
+
+# Explicit table-finder settings (pdfplumber's line-based defaults, spelled
+# out) so find_tables can stop after geometry detection on table-less pages
+# instead of always running the full cell-extraction pipeline.
+_TABLE_FINDER_SETTINGS = {
+    'vertical_strategy': 'lines',
+    'horizontal_strategy': 'lines',
+    'intersection_tolerance': 3,
+}
+
+# Chart keywords joined into one case-insensitive alternation; a single
+# search() over the page text replaces a per-line lowercased substring scan.
+_CHART_KW_RE = re.compile(
+    '|'.join(re.escape(keyword) for keyword in PDFParserConfig.CHART_KEYWORDS),
+    re.IGNORECASE,
+)
+
+# pyahocorasick, when installed, finds the first of the chart keywords in a
+# single O(len(text)) automaton walk independent of keyword count; the
+# compiled alternation above remains the fallback.
+try:
+    import ahocorasick
+    _CHART_AC = ahocorasick.Automaton()
+    for _keyword in PDFParserConfig.CHART_KEYWORDS:
+        _CHART_AC.add_word(_keyword.lower(), _keyword)
+    _CHART_AC.make_automaton()
+    del _keyword
+except ImportError:
+    _CHART_AC = None
+
+def _find_chart_keyword(text: str) -> Optional[tuple]:
+    """
+    Locate the first chart keyword hit in the given text.
+
+    Args:
+        text (str): Page text to scan
+
+    Returns:
+        Optional[tuple]: (start, end) span of the hit, or None
+    """
+    if _CHART_AC is not None:
+        lowered = text.lower()
+        # str.lower() can change a string's length (e.g. 'İ' lowers to two
+        # code points), which would shift the span relative to the original
+        # text the caller slices; in that rare case use the regex fallback,
+        # which searches the original text case-insensitively.
+        if len(lowered) == len(text):
+            for end_index, keyword in _CHART_AC.iter(lowered):
+                return end_index - len(keyword) + 1, end_index + 1
+            return None
+    match = _CHART_KW_RE.search(text)
+    if match:
+        return match.start(), match.end()
+    return None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True)
+class Segment:
+    """
+    A paragraph of text attributed to its enclosing section/subsection.
+
+    Slotted so that the many thousands of segments a large document
+    produces carry no per-instance __dict__; they are rendered to plain
+    dicts only at serialization time.
+    """
+    section: Optional[str]
+    sub_section: Optional[str]
+    text: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the segment as the output JSON shape."""
+        return {
+            "type": "paragraph",
+            "section": self.section,
+            "sub_section": self.sub_section,
+            "text": self.text
+        }
+
+@dataclass(slots=True)
+class PageData:
+    """
+    Extracted content for a single page.
+
+    Slotted like Segment so a long document's worth of pages carries no
+    per-instance __dict__ overhead.
+    """
+    page_number: int
+    content: List[Any] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the page as the output JSON shape."""
+        return {
+            "page_number": self.page_number,
+            "content": self.content
+        }
+
+def _json_default(obj):
+    """JSON encoder hook for the slotted content containers."""
+    if isinstance(obj, (Segment, PageData)):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes, via orjson when available."""
+    if orjson is not None:
+        # OPT_PASSTHROUGH_DATACLASS routes dataclasses through the default
+        # hook so they are rendered via to_dict(), not field-by-field.
+        return orjson.dumps(obj, default=_json_default,
+                            option=orjson.OPT_PASSTHROUGH_DATACLASS)
+    return json.dumps(obj, ensure_ascii=False, default=_json_default).encode('utf-8')
+
 class PDFParser:
     """
     A robust PDF parser that extracts structured content into JSON format.
@@ -38,6 +208,7 @@ class PDFParser:
         """
         self.pdf_path = pdf_path
         self.document = None
+        self.fitz_doc = None
         self.extracted_data = {
             "pages": [],
             "metadata": {
@@ -58,12 +229,35 @@ class PDFParser:
             self.document = pdfplumber.open(self.pdf_path)
             self.extracted_data["metadata"]["total_pages"] = len(self.document.pages)
             logger.info(f"Successfully loaded PDF: {self.pdf_path}")
-            return True
         except Exception as e:
             logger.error(f"Error loading PDF: {e}")
             return False
 
-    def extract_sections_from_text(self, text: str) -> List[Dict[str, str]]:
+        # PyMuPDF's C text extraction is much faster than pdfminer's, so a
+        # second handle is kept for the text path; pdfplumber remains the
+        # backend for tables and images.
+        try:
+            self.fitz_doc = fitz.open(self.pdf_path)
+        except Exception as e:
+            logger.warning(f"Could not open PDF with PyMuPDF, "
+                           f"falling back to pdfplumber for text: {e}")
+            self.fitz_doc = None
+
+        return True
+
+    def _fast_text(self, page_num: int) -> str:
+        """
+        Extract page text via PyMuPDF.
+
+        Args:
+            page_num (int): Page number (1-indexed)
+
+        Returns:
+            str: Extracted plain text for the page
+        """
+        return self.fitz_doc.load_page(page_num - 1).get_text("text")
+
+    def extract_sections_from_text(self, text: str) -> List[Segment]:
         """
         Extract section and subsection information from text using patterns.
 
@@ -71,69 +265,59 @@ class PDFParser:
             text (str): Input text to analyze
 
         Returns:
-            List[Dict]: List of text segments with section information
+            List[Segment]: List of text segments with section information
         """
-        # Common section patterns
-        section_patterns = [
-            r'^\d+\.\s+([A-Z][^\n]+)$',  # 1. Section Name
-            r'^([A-Z][A-Z\s]+)$',           # ALL CAPS SECTIONS
-            r'^([A-Z][a-z\s]+):',           # Title Case:
-            r'^\*\*([^\*]+)\*\*',       # **Bold sections**
-        ]
+        return self._segments_from_matches(
+            text,
+            ((match.start(), match.end(), match.lastgroup,
+              match.group(match.lastgroup))
+             for match in _SECTION_UNION.finditer(text))
+        )
+
+    def _segments_from_matches(self, text: str, matches) -> List[Segment]:
+        """
+        Build paragraph segments from heading match spans.
 
-        lines = text.split('\n')
+        Args:
+            text (str): Source text the spans refer to
+            matches: Iterable of (start, end, group_name, title) tuples
+
+        Returns:
+            List[Segment]: List of text segments with section information
+        """
         segments = []
         current_section = None
         current_subsection = None
-        current_text = []
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            is_section = False
-            for pattern in section_patterns:
-                match = re.match(pattern, line)
-                if match:
-                    # Save previous segment if exists
-                    if current_text:
-                        segments.append({
-                            "type": "paragraph",
-                            "section": current_section,
-                            "sub_section": current_subsection,
-                            "text": " ".join(current_text).strip()
-                        })
-                        current_text = []
-
-                    # Update section context
-                    if pattern == section_patterns[0] or pattern == section_patterns[1]:
-                        current_section = match.group(1).strip()
-                        current_subsection = None
-                    else:
-                        current_subsection = match.group(1).strip()
-
-                    is_section = True
-                    break
-
-            if not is_section:
-                current_text.append(line)
+        def flush_segment(chunk: str):
+            # Normalize the chunk between two headings into one paragraph.
+            # splitlines() avoids the trailing empty element split('\n')
+            # produces, and map/filter keep the strip pass at C speed
+            # without materializing an intermediate list. Every joined line
+            # is already stripped, so the result needs no second strip.
+            body = " ".join(filter(None, map(str.strip, chunk.splitlines())))
+            if body:
+                segments.append(Segment(current_section, current_subsection, body))
+
+        # The text between consecutive heading spans becomes a paragraph
+        # segment attributed to the section context at that point.
+        last_end = 0
+        for start, end, group, title in matches:
+            flush_segment(text[last_end:start])
+            last_end = end
+
+            # Update section context
+            title = title.strip()
+            if group in _SECTION_GROUPS:
+                current_section = title
+                current_subsection = None
+            else:
+                current_subsection = title
 
         # Add final segment
-        if current_text:
-            segments.append({
-                "type": "paragraph",
-                "section": current_section,
-                "sub_section": current_subsection,
-                "text": " ".join(current_text).strip()
-            })
-
-        return segments if segments else [{
-            "type": "paragraph",
-            "section": None,
-            "sub_section": None,
-            "text": text.strip()
-        }]
+        flush_segment(text[last_end:])
+
+        return segments if segments else [Segment(None, None, text.strip())]
 
     def extract_tables(self, page) -> List[Dict[str, Any]]:
         """
@@ -147,33 +331,48 @@ class PDFParser:
         """
         tables = []
         try:
-            page_tables = page.extract_tables()
-            for i, table in enumerate(page_tables):
-                if table and len(table) > 0:
-                    # Clean table data
-                    cleaned_table = []
-                    for row in table:
-                        cleaned_row = [cell.strip() if cell else "" for cell in row]
-                        cleaned_table.append(cleaned_row)
-
-                    tables.append({
-                        "type": "table",
-                        "section": f"Table {i+1}",
-                        "sub_section": None,
-                        "description": f"Extracted table with {len(cleaned_table)} rows and {len(cleaned_table[0]) if cleaned_table else 0} columns",
-                        "table_data": cleaned_table
-                    })
+            # Geometry detection first: when the page has no ruled tables
+            # this returns empty without paying for cell extraction
+            found_tables = page.find_tables(table_settings=_TABLE_FINDER_SETTINGS)
+            if not found_tables:
+                return tables
+
+            min_rows = PDFParserConfig.TABLE_SETTINGS['min_rows']
+            min_cols = PDFParserConfig.TABLE_SETTINGS['min_cols']
+            for i, found in enumerate(found_tables):
+                table = found.extract()
+                # Honor the configured minimum table dimensions
+                if not table or len(table) < min_rows:
+                    continue
+                if not table[0] or len(table[0]) < min_cols:
+                    continue
+
+                # Clean table data in bulk: pandas' C string kernels
+                # strip whole columns at once instead of a Python-level
+                # per-cell loop, and fillna covers None cells (padding
+                # ragged rows to the widest row as a side effect).
+                frame = pd.DataFrame(table).fillna("")
+                cleaned_table = frame.apply(lambda col: col.str.strip()).values.tolist()
+
+                tables.append({
+                    "type": "table",
+                    "section": f"Table {i+1}",
+                    "sub_section": None,
+                    "description": f"Extracted table with {len(cleaned_table)} rows and {len(cleaned_table[0]) if cleaned_table else 0} columns",
+                    "table_data": cleaned_table
+                })
         except Exception as e:
             logger.warning(f"Error extracting tables: {e}")
 
         return tables
 
-    def detect_charts(self, page) -> List[Dict[str, Any]]:
+    def detect_charts(self, page, text: str) -> List[Dict[str, Any]]:
         """
         Detect and extract chart information from a PDF page.
 
         Args:
             page: pdfplumber page object
+            text (str): Page text already extracted by the caller
 
         Returns:
             List[Dict]: List of detected charts with metadata
@@ -181,13 +380,30 @@ class PDFParser:
         charts = []
         try:
             # Look for images that might be charts
-            if hasattr(page, 'images') and page.images:
-                for i, img in enumerate(page.images):
+            images = page.images if hasattr(page, 'images') else None
+            if images:
+                # page.chars is parsed once per page; filtering it by bbox
+                # gives the context text without re-running pdfminer layout
+                # analysis per image the way within_bbox().extract_text() did.
+                # The coordinates are pulled out of the char dicts once into
+                # struct-of-arrays NumPy columns, so each image bbox costs a
+                # vectorized comparison rather than a per-char dict walk.
+                chars = page.chars
+                char_count = len(chars)
+                char_x0 = np.fromiter((c['x0'] for c in chars),
+                                      dtype=np.float32, count=char_count)
+                char_top = np.fromiter((c['top'] for c in chars),
+                                       dtype=np.float32, count=char_count)
+                for i, img in enumerate(images):
                     # Extract image properties
                     bbox = (img['x0'], img['top'], img['x1'], img['bottom'])
 
-                    # Try to extract text near the image for context
-                    nearby_text = page.within_bbox(bbox).extract_text()
+                    # Gather the text of characters falling inside the bbox
+                    mask = ((char_x0 >= bbox[0]) & (char_x0 <= bbox[2])
+                            & (char_top >= bbox[1]) & (char_top <= bbox[3]))
+                    nearby_text = "".join(
+                        chars[j]['text'] for j in np.flatnonzero(mask)
+                    )
 
                     chart_info = {
                         "type": "chart",
@@ -199,67 +415,249 @@ class PDFParser:
                     }
                     charts.append(chart_info)
 
-            # Also look for chart-like patterns in text
-            text = page.extract_text()
+            # Also look for chart-like patterns in text: one compiled search
+            # over the full page text finds the first keyword hit, then the
+            # containing line is sliced out by its newline offsets.
             if text:
-                chart_keywords = ['chart', 'graph', 'figure', 'diagram', 'plot']
-                lines = text.split('\n')
-                for line in lines:
-                    if any(keyword in line.lower() for keyword in chart_keywords):
-                        charts.append({
-                            "type": "chart",
-                            "section": "Text-referenced Chart",
-                            "sub_section": None,
-                            "description": line.strip(),
-                            "chart_data": [],
-                            "context_text": line.strip()
-                        })
-                        break
+                span = _find_chart_keyword(text)
+                if span:
+                    line_start = text.rfind('\n', 0, span[0]) + 1
+                    line_end = text.find('\n', span[1])
+                    if line_end == -1:
+                        line_end = len(text)
+                    line = text[line_start:line_end].strip()
+                    charts.append({
+                        "type": "chart",
+                        "section": "Text-referenced Chart",
+                        "sub_section": None,
+                        "description": line,
+                        "chart_data": [],
+                        "context_text": line
+                    })
 
         except Exception as e:
             logger.warning(f"Error detecting charts: {e}")
 
         return charts
 
-    def process_page(self, page_num: int, page) -> Dict[str, Any]:
+    def _batch_extract_sections(self):
+        """
+        Run section detection once over the whole document.
+
+        Concatenates every page's text (cheap with the PyMuPDF handle) and
+        scans the heading union a single time, then maps the match spans
+        back onto their pages by offset, so the regex engine is entered
+        once per document instead of once per page.
+
+        Returns:
+            tuple: (page_texts, segments_by_page), both indexed by page - 1
+        """
+        page_count = len(self.document.pages)
+        page_texts = [self._fast_text(page_num)
+                      for page_num in range(1, page_count + 1)]
+        joined = "\n".join(page_texts)
+
+        # Page i occupies joined[bounds[i-1]:bounds[i] - 1]
+        bounds = np.cumsum([len(text) + 1 for text in page_texts])
+        matches_by_page = [[] for _ in page_texts]
+        for match in _SECTION_UNION.finditer(joined):
+            idx = int(np.searchsorted(bounds, match.start(), side='right'))
+            page_start = int(bounds[idx - 1]) if idx else 0
+            page_end = int(bounds[idx]) - 1
+
+            if match.end() <= page_end:
+                matches_by_page[idx].append((
+                    match.start() - page_start,
+                    match.end() - page_start,
+                    match.lastgroup,
+                    match.group(match.lastgroup),
+                ))
+                continue
+
+            # The match straddles the page delimiter. A heading must never
+            # cross pages (the per-page paths cannot produce one), so
+            # instead of clamping the span each page's slice of it is
+            # re-scanned on its own, matching what per-page detection
+            # would have found.
+            while page_start < match.end():
+                chunk_start = max(match.start(), page_start)
+                chunk = joined[chunk_start:min(match.end(), page_end)]
+                for sub in _SECTION_UNION.finditer(chunk):
+                    matches_by_page[idx].append((
+                        chunk_start - page_start + sub.start(),
+                        chunk_start - page_start + sub.end(),
+                        sub.lastgroup,
+                        sub.group(sub.lastgroup),
+                    ))
+                idx += 1
+                if idx >= page_count:
+                    break
+                page_start = int(bounds[idx - 1])
+                page_end = int(bounds[idx]) - 1
+
+        segments_by_page = [
+            self._segments_from_matches(text, matches)
+            for text, matches in zip(page_texts, matches_by_page)
+        ]
+        return page_texts, segments_by_page
+
+    def process_page(self, page_num: int, page,
+                     text: Optional[str] = None,
+                     segments: Optional[List[Segment]] = None) -> PageData:
         """
         Process a single PDF page and extract all content types.
 
         Args:
             page_num (int): Page number (1-indexed)
             page: pdfplumber page object
+            text (str, optional): Page text already extracted by the caller
+            segments (List[Segment], optional): Precomputed text segments
+                from the batched whole-document section scan
 
         Returns:
-            Dict: Processed page data
+            PageData: Processed page data
         """
         logger.info(f"Processing page {page_num}")
 
-        page_data = {
-            "page_number": page_num,
-            "content": []
-        }
+        page_data = PageData(page_number=page_num)
+
+        # Extract text content once; section detection and chart detection
+        # both consume the same string, avoiding a second pdfminer pass.
+        # PyMuPDF does the extraction when available, pdfminer otherwise.
+        if text is None:
+            if self.fitz_doc is not None:
+                text = self._fast_text(page_num)
+            else:
+                text = page.extract_text() or ""
+
+        # Blank or purely decorative pages (covers, dividers) have neither
+        # text nor images; skip the table and chart passes entirely so they
+        # never pay pdfminer layout analysis
+        if not text and not page.images:
+            return page_data
 
-        # Extract text content
-        text = page.extract_text()
         if text:
             # Extract structured text with sections
-            text_segments = self.extract_sections_from_text(text)
-            page_data["content"].extend(text_segments)
+            text_segments = (segments if segments is not None
+                             else self.extract_sections_from_text(text))
+            page_data.content.extend(text_segments)
 
         # Extract tables
         tables = self.extract_tables(page)
-        page_data["content"].extend(tables)
+        page_data.content.extend(tables)
 
         # Detect charts
-        charts = self.detect_charts(page)
-        page_data["content"].extend(charts)
+        charts = self.detect_charts(page, text)
+        page_data.content.extend(charts)
 
         return page_data
 
+    def iter_pages(self):
+        """
+        Lazily process pages one at a time.
+
+        Yields PageData objects in page order without accumulating them,
+        so peak memory stays at roughly one processed page regardless of
+        document size. The PDF must have been opened with load_pdf() first.
+        Pages are processed in parallel when configured; per-page work is
+        CPU-bound in pdfminer, so a process pool scales with cores and
+        executor.map preserves page order.
+
+        Yields:
+            PageData: Processed page data
+        """
+        total_pages = len(self.document.pages)
+        if PDFParserConfig.PERFORMANCE['parallel_processing'] and total_pages > 1:
+            max_workers = PDFParserConfig.PERFORMANCE['max_workers']
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                yield from executor.map(
+                    partial(_process_page_worker, self.pdf_path),
+                    range(1, total_pages + 1),
+                    chunksize=4
+                )
+        else:
+            # With the PyMuPDF handle available, section detection for the
+            # whole document is batched into a single regex scan up front
+            page_texts = segments_by_page = None
+            if self.fitz_doc is not None:
+                page_texts, segments_by_page = self._batch_extract_sections()
+
+            for page_num, page in enumerate(self.document.pages, 1):
+                if segments_by_page is not None:
+                    yield self.process_page(page_num, page,
+                                            text=page_texts[page_num - 1],
+                                            segments=segments_by_page[page_num - 1])
+                else:
+                    yield self.process_page(page_num, page)
+                # Release pdfminer's per-page object caches promptly so
+                # memory does not grow with pages already processed
+                if hasattr(page, 'flush_cache'):
+                    page.flush_cache()
+
+    def _write_pages_parallel(self, out_file) -> int:
+        """
+        Process pages in the pool and splice their JSON shards into out_file.
+
+        Each worker serializes its own page and writes it to a temp shard
+        file, so only a short path travels back over IPC instead of a
+        pickled page dict. The parent concatenates the shards with
+        os.sendfile (zero-copy in the kernel), falling back to a buffered
+        copy where sendfile is unavailable.
+
+        Args:
+            out_file: Binary output file positioned inside the pages array
+
+        Returns:
+            int: Number of pages written
+        """
+        total_pages = len(self.document.pages)
+        max_workers = PDFParserConfig.PERFORMANCE['max_workers']
+        pages_written = 0
+
+        with tempfile.TemporaryDirectory(prefix="pdf_parser_shards_") as shard_dir:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                for shard_path in executor.map(
+                        partial(_process_page_to_shard, self.pdf_path, shard_dir),
+                        range(1, total_pages + 1),
+                        chunksize=4):
+                    if pages_written:
+                        out_file.write(b',\n')
+                    out_file.flush()
+                    with open(shard_path, 'rb') as shard:
+                        size = os.fstat(shard.fileno()).st_size
+                        offset = 0
+                        try:
+                            while offset < size:
+                                offset += os.sendfile(out_file.fileno(),
+                                                      shard.fileno(),
+                                                      offset, size - offset)
+                        except OSError:
+                            # Resume from wherever sendfile stopped so an
+                            # error after a partial transfer never splices
+                            # already-written bytes twice
+                            shard.seek(offset)
+                            shutil.copyfileobj(shard, out_file)
+                    os.unlink(shard_path)
+                    pages_written += 1
+
+        return pages_written
+
+    def close(self):
+        """Close any open document handles."""
+        if self.document:
+            self.document.close()
+            self.document = None
+        if self.fitz_doc:
+            self.fitz_doc.close()
+            self.fitz_doc = None
+
     def extract_to_json(self) -> Dict[str, Any]:
         """
         Extract content from all pages and return structured JSON.
 
+        This accumulates every page in memory; for large documents prefer
+        save_json(), which streams pages to disk via iter_pages().
+
         Returns:
             Dict: Complete extracted data in JSON format
         """
@@ -271,18 +669,14 @@ class PDFParser:
             from datetime import datetime
             self.extracted_data["metadata"]["extraction_timestamp"] = datetime.now().isoformat()
 
-            # Process each page
-            for page_num, page in enumerate(self.document.pages, 1):
-                page_data = self.process_page(page_num, page)
-                self.extracted_data["pages"].append(page_data)
+            self.extracted_data["pages"].extend(self.iter_pages())
 
             logger.info(f"Successfully extracted content from {len(self.extracted_data['pages'])} pages")
 
         except Exception as e:
             logger.error(f"Error during extraction: {e}")
         finally:
-            if self.document:
-                self.document.close()
+            self.close()
 
         return self.extracted_data
 
@@ -290,20 +684,110 @@ class PDFParser:
         """
         Save extracted data to JSON file.
 
+        If extract_to_json() has already accumulated pages, that data is
+        dumped directly. Otherwise the document is opened and pages are
+        processed lazily via iter_pages() and written one at a time, so
+        only one page of extracted content is ever resident in memory.
+
         Args:
             output_path (str): Path where JSON file will be saved
 
         Returns:
             bool: True if successful, False otherwise
         """
+        if self.extracted_data["pages"]:
+            try:
+                if orjson is not None:
+                    with open(output_path, 'wb') as f:
+                        f.write(orjson.dumps(
+                            self.extracted_data,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS,
+                            default=_json_default))
+                else:
+                    with open(output_path, 'w', encoding='utf-8') as f:
+                        json.dump(self.extracted_data, f, indent=2,
+                                  ensure_ascii=False, default=_json_default)
+                logger.info(f"JSON file saved successfully: {output_path}")
+                return True
+            except Exception as e:
+                logger.error(f"Error saving JSON file: {e}")
+                return False
+
+        # Streaming path: process and write page by page
+        if not self.load_pdf():
+            return False
+
+        from datetime import datetime
+        self.extracted_data["metadata"]["extraction_timestamp"] = datetime.now().isoformat()
+
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(self.extracted_data, f, indent=2, ensure_ascii=False)
+            with open(output_path, 'wb') as f:
+                f.write(b'{\n"metadata": ')
+                f.write(_dumps(self.extracted_data["metadata"]))
+                f.write(b',\n"pages": [\n')
+                total_pages = len(self.document.pages)
+                if PDFParserConfig.PERFORMANCE['parallel_processing'] and total_pages > 1:
+                    pages_written = self._write_pages_parallel(f)
+                else:
+                    pages_written = 0
+                    for page_data in self.iter_pages():
+                        if pages_written:
+                            f.write(b',\n')
+                        f.write(_dumps(page_data))
+                        pages_written += 1
+                f.write(b'\n]\n}')
+            logger.info(f"Successfully extracted content from {pages_written} pages")
             logger.info(f"JSON file saved successfully: {output_path}")
             return True
         except Exception as e:
             logger.error(f"Error saving JSON file: {e}")
             return False
+        finally:
+            self.close()
+
+def _process_page_worker(pdf_path: str, page_num: int) -> PageData:
+    """
+    Process a single page in a worker process.
+
+    pdfplumber objects do not pickle, so each worker re-opens the PDF and
+    loads only the page it needs.
+
+    Args:
+        pdf_path (str): Path to the PDF file being parsed
+        page_num (int): Page number (1-indexed)
+
+    Returns:
+        PageData: Processed page data
+    """
+    worker = PDFParser(pdf_path)
+    try:
+        worker.fitz_doc = fitz.open(pdf_path)
+    except Exception as e:
+        logger.warning(f"Could not open PDF with PyMuPDF in worker: {e}")
+    try:
+        with pdfplumber.open(pdf_path) as pdf:
+            return worker.process_page(page_num, pdf.pages[page_num - 1])
+    finally:
+        if worker.fitz_doc:
+            worker.fitz_doc.close()
+
+def _process_page_to_shard(pdf_path: str, shard_dir: str, page_num: int) -> str:
+    """
+    Process one page in a worker and write its JSON to a shard file.
+
+    Args:
+        pdf_path (str): Path to the PDF file being parsed
+        shard_dir (str): Directory the shard file is written into
+        page_num (int): Page number (1-indexed)
+
+    Returns:
+        str: Path of the written shard file
+    """
+    page_data = _process_page_worker(pdf_path, page_num)
+    shard_path = os.path.join(shard_dir, f"page_{page_num:06d}.json")
+    with open(shard_path, 'wb') as f:
+        f.write(_dumps(page_data))
+    return shard_path
 
 def main():
     """
@@ -331,22 +815,18 @@ def main():
         base_name = Path(args.pdf_file).stem
         output_path = f"{base_name}_extracted.json"
 
-    # Initialize parser and extract content
+    # Initialize parser and extract content, streaming pages straight to
+    # the output file so large documents never live fully in memory
     pdf_parser = PDFParser(args.pdf_file)
-    extracted_data = pdf_parser.extract_to_json()
-
-    if not extracted_data:
-        logger.error("Failed to extract content from PDF")
-        return 1
 
-    # Save results
     if pdf_parser.save_json(output_path):
         logger.info(f"Extraction completed successfully!")
         logger.info(f"Input: {args.pdf_file}")
         logger.info(f"Output: {output_path}")
-        logger.info(f"Pages processed: {extracted_data['metadata']['total_pages']}")
+        logger.info(f"Pages processed: {pdf_parser.extracted_data['metadata']['total_pages']}")
         return 0
     else:
+        logger.error("Failed to extract content from PDF")
         return 1
 
 if __name__ == "__main__":